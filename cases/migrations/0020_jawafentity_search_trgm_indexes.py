@@ -0,0 +1,90 @@
+"""
+Trigram indexes backing the entity search endpoint.
+
+JawafEntityViewSet searches nes_id and display_name with DRF's SearchFilter,
+which PostgreSQL executes as ``UPPER(col::text) LIKE UPPER('%term%')``. A
+leading wildcard cannot use the existing btree index on nes_id, so every
+search scanned the whole table. GIN indexes with ``gin_trgm_ops`` over the
+same ``UPPER(col::text)`` expression let the planner answer those lookups
+from the index while keeping substring semantics unchanged.
+
+The indexes are PostgreSQL-only, so they are kept out of JawafEntity.Meta and
+out of migration state: they are created here on PostgreSQL and skipped
+entirely on SQLite development/test databases, where the autodetector and
+table remakes never see them.
+
+The extension step runs ``CREATE EXTENSION IF NOT EXISTS pg_trgm``, which
+needs a role with CREATE privilege on the database (PostgreSQL 13+, where
+pg_trgm is a trusted extension) or superuser. If the deploy role lacks it,
+have a database owner create the extension once before migrating.
+"""
+
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+from django.db.models.functions import Cast, Upper
+
+
+class PostgreSQLTrigramExtension(TrigramExtension):
+    """TrigramExtension that only touches the database on PostgreSQL.
+
+    CreateExtension already skips other backends going forwards, but its
+    database_backwards queries pg_extension unconditionally.
+    """
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+class PostgreSQLAddIndex(migrations.AddIndex):
+    """AddIndex that only touches the schema on PostgreSQL."""
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cases", "0019_add_publication_date_to_documentsource"),
+    ]
+
+    operations = [
+        PostgreSQLTrigramExtension(),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                PostgreSQLAddIndex(
+                    model_name="jawafentity",
+                    index=GinIndex(
+                        OpClass(
+                            Upper(Cast("nes_id", output_field=models.TextField())),
+                            name="gin_trgm_ops",
+                        ),
+                        name="jawafentity_nes_id_trgm_idx",
+                    ),
+                ),
+                PostgreSQLAddIndex(
+                    model_name="jawafentity",
+                    index=GinIndex(
+                        OpClass(
+                            Upper(
+                                Cast("display_name", output_field=models.TextField())
+                            ),
+                            name="gin_trgm_ops",
+                        ),
+                        name="jawafentity_dname_trgm_idx",
+                    ),
+                ),
+            ],
+            state_operations=[],
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.9 on 2026-10-17 10:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cases", "0020_jawafentity_search_trgm_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="case",
+            index=models.Index(fields=["state", "id"], name="case_state_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="case",
+            index=models.Index(
+                condition=models.Q(("state", "PUBLISHED")),
+                fields=["id"],
+                name="case_published_idx",
+            ),
+        ),
+    ]
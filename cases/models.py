@@ -11,6 +11,7 @@ from django.core.validators import URLValidator
 from django.utils import timezone
 from django.utils.text import slugify
 import mimetypes
+import os
 import uuid
 
 from .fields import (
@@ -65,6 +66,11 @@ ALLOWED_UPLOAD_MIMETYPES = [
 ]
 MAX_UPLOAD_FILE_SIZE = 10 * 1024 * 1024  # 10 MB in bytes
 
+# Set views of the lists above for O(1) membership checks; the lists keep
+# their order for error messages.
+_ALLOWED_UPLOAD_EXTENSION_SET = frozenset(ALLOWED_UPLOAD_EXTENSIONS)
+_ALLOWED_UPLOAD_MIMETYPE_SET = frozenset(ALLOWED_UPLOAD_MIMETYPES)
+
 
 def validate_upload_file_extension(file):
     """
@@ -79,10 +85,8 @@ def validate_upload_file_extension(file):
     if not file:
         return
 
-    import os
-
     ext = os.path.splitext(file.name)[1].lstrip(".").lower()
-    if ext not in ALLOWED_UPLOAD_EXTENSIONS:
+    if ext not in _ALLOWED_UPLOAD_EXTENSION_SET:
         allowed = ", ".join(ALLOWED_UPLOAD_EXTENSIONS)
         raise ValidationError(
             f"File extension '.{ext}' is not allowed. Allowed extensions: {allowed}"
@@ -127,7 +131,7 @@ def validate_upload_file_mimetype(file):
         return
 
     content_type = getattr(file, "content_type", None)
-    if content_type and content_type not in ALLOWED_UPLOAD_MIMETYPES:
+    if content_type and content_type not in _ALLOWED_UPLOAD_MIMETYPE_SET:
         allowed = ", ".join(ALLOWED_UPLOAD_MIMETYPES)
         raise ValidationError(
             f"File MIME type '{content_type}' is not allowed. Allowed types: {allowed}"
@@ -175,6 +179,8 @@ class JawafEntity(models.Model):
                 name="jawafentity_must_have_nes_id_or_display_name",
             )
         ]
+        # The entity search endpoint's trigram indexes are PostgreSQL-only
+        # and live solely in migration 0020, outside the model state.
 
     def __str__(self):
         if self.nes_id:
@@ -229,13 +235,22 @@ class JawafEntity(models.Model):
         """
         usage = []
 
-        # Check if used in unified relationship system
-        case_relationship_count = self.case_relationships.count()
+        # Count case relationships and active (not soft-deleted) document
+        # sources in one query; distinct guards against the join fan-out.
+        counts = JawafEntity.objects.filter(pk=self.pk).aggregate(
+            case_relationships=models.Count("case_relationships", distinct=True),
+            sources=models.Count(
+                "document_sources",
+                filter=models.Q(document_sources__is_deleted=False),
+                distinct=True,
+            ),
+        )
+
+        case_relationship_count = counts["case_relationships"]
         if case_relationship_count > 0:
             usage.append(f"entity relationship in {case_relationship_count} case(s)")
 
-        # Check if used in active document sources (exclude soft-deleted)
-        source_count = self.document_sources.filter(is_deleted=False).count()
+        source_count = counts["sources"]
         if source_count > 0:
             usage.append(f"related entity in {source_count} document source(s)")
 
@@ -511,6 +526,16 @@ class Case(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Covers "state IN (...)" joins that only need case ids, e.g. the
+            # entity endpoints' published-relationship lookups.
+            models.Index(fields=["state", "id"], name="case_state_id_idx"),
+            models.Index(
+                fields=["id"],
+                condition=models.Q(state=CaseState.PUBLISHED),
+                name="case_published_idx",
+            ),
+        ]
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -55,15 +55,20 @@ class JawafEntitySerializer(serializers.ModelSerializer):
 
         Only includes PUBLISHED cases. Uses the unified relationship system.
         Each entry includes relation metadata required by the frontend.
+
+        JawafEntityViewSet prefetches these rows into
+        ``published_case_relationships``; other callers fall back to a query.
         """
-        relationships = (
-            CaseEntityRelationship.objects.filter(
-                entity=obj,
-                case__state=CaseState.PUBLISHED,
+        relationships = getattr(obj, "published_case_relationships", None)
+        if relationships is None:
+            relationships = (
+                CaseEntityRelationship.objects.filter(
+                    entity=obj,
+                    case__state=CaseState.PUBLISHED,
+                )
+                .only("case", "relationship_type", "notes")
+                .order_by("-case_id", "relationship_type")
             )
-            .select_related("case")
-            .order_by("-case_id", "relationship_type")
-        )
 
         return [
             {
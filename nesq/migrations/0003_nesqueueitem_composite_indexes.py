@@ -0,0 +1,34 @@
+# Generated by Django 5.2.8 on 2026-10-17 09:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("nesq", "0002_alter_nesqueueitem_action"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="nesqueueitem",
+            index=models.Index(
+                fields=["status", "created_at"], name="nesq_status_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="nesqueueitem",
+            index=models.Index(
+                fields=["submitted_by", "-created_at"],
+                name="nesq_submitter_created_idx",
+            ),
+        ),
+        # Dropped after the composite index exists so status lookups stay
+        # indexed; nesq_status_idx is a strict prefix of it.
+        migrations.RemoveIndex(
+            model_name="nesqueueitem",
+            name="nesq_status_idx",
+        ),
+    ]
@@ -117,7 +117,17 @@ class NESQueueItem(models.Model):
     class Meta:
         ordering = ["created_at"]
         indexes = [
-            models.Index(fields=["status"], name="nesq_status_idx"),
+            # Processor polls APPROVED items oldest-first; admin filters by
+            # status and date. Also serves plain status lookups, so there is
+            # no separate status-only index.
+            models.Index(
+                fields=["status", "created_at"], name="nesq_status_created_idx"
+            ),
+            # "My submissions" API lists a user's items newest-first.
+            models.Index(
+                fields=["submitted_by", "-created_at"],
+                name="nesq_submitter_created_idx",
+            ),
         ]
         verbose_name = "NES Queue Item"
         verbose_name_plural = "NES Queue Items"
@@ -0,0 +1,17 @@
+"""
+Shared fixtures for API tests.
+"""
+
+import pytest
+from rest_framework.test import APIClient
+
+
+@pytest.fixture
+def api_client():
+    """
+    Fresh anonymous APIClient for each test.
+
+    Building a client is cheap, and a new one per test keeps cookies,
+    sessions and credentials from leaking between tests.
+    """
+    return APIClient()
@@ -7,7 +7,7 @@ Tests entity listing, retrieval, search, and pagination
 
 import pytest
 
-from django.core.cache import cache
+from django.db import transaction
 from hypothesis import given, strategies as st, settings
 from rest_framework.test import APIClient
 
@@ -18,39 +18,17 @@ from cases.models import (
     JawafEntity,
     RelationshipType,
 )
+from tests.strategies import valid_entity_id
 
-
-@pytest.fixture(autouse=True)
-def clear_cache():
-    """Clear cache before each test."""
-    cache.clear()
-    yield
-    cache.clear()
-
-
-# ============================================================================
-# Hypothesis Strategies
-# ============================================================================
-
-
-@st.composite
-def valid_entity_id(draw):
-    """Generate valid entity IDs matching NES format."""
-    entity_types = ["person", "organization", "location"]
-    entity_type = draw(st.sampled_from(entity_types))
-
-    slug = draw(
-        st.text(
-            alphabet="abcdefghijklmnopqrstuvwxyz0123456789-", min_size=3, max_size=50
-        ).filter(
-            lambda x: x
-            and not x.startswith("-")
-            and not x.endswith("-")
-            and "--" not in x
-        )
-    )
-
-    return f"entity:{entity_type}/{slug}"
+# Display names with at least one non-whitespace character, built without a
+# .filter(): a required non-whitespace character (no Z*/Cc categories) sits
+# between a free head and tail, so leading and trailing whitespace are still
+# generated.
+_display_name = st.tuples(
+    st.text(max_size=49),
+    st.characters(blacklist_categories=("Zs", "Zl", "Zp", "Cc", "Cs")),
+    st.text(max_size=50),
+).map("".join)
 
 
 # ============================================================================
@@ -59,10 +37,9 @@ def valid_entity_id(draw):
 
 
 @pytest.mark.django_db
-def test_entity_list_endpoint_returns_200():
+def test_entity_list_endpoint_returns_200(api_client):
     """Test that the entity list endpoint is accessible."""
-    client = APIClient()
-    response = client.get("/api/entities/")
+    response = api_client.get("/api/entities/")
 
     assert response.status_code == 200
     assert "results" in response.data
@@ -70,17 +47,21 @@ def test_entity_list_endpoint_returns_200():
 
 
 @pytest.mark.django_db
-def test_entity_list_includes_all_entities():
+def test_entity_list_includes_all_entities(api_client):
     """Test that the entity list includes all entities in published cases."""
-    from cases.models import (
-        JawafEntity,
-    )
-
-    # Create test entities
-    entity1 = JawafEntity.objects.create(nes_id="entity:person/test-person")
-    entity2 = JawafEntity.objects.create(display_name="Custom Entity")
-    entity3 = JawafEntity.objects.create(
-        nes_id="entity:organization/test-org", display_name="Test Organization"
+    # Create test entities in a single INSERT; only their ids are needed
+    alleged_id1, alleged_id2, related_id = (
+        entity.id
+        for entity in JawafEntity.objects.bulk_create(
+            [
+                JawafEntity(nes_id="entity:person/test-person"),
+                JawafEntity(display_name="Custom Entity"),
+                JawafEntity(
+                    nes_id="entity:organization/test-org",
+                    display_name="Test Organization",
+                ),
+            ]
+        )
     )
 
     # Create published case with entities
@@ -91,35 +72,31 @@ def test_entity_list_includes_all_entities():
         description="Test",
     )
     CaseEntityRelationship.objects.create(
-        case=case, entity=entity1, relationship_type=RelationshipType.ALLEGED
+        case=case, entity_id=alleged_id1, relationship_type=RelationshipType.ALLEGED
     )
     CaseEntityRelationship.objects.create(
-        case=case, entity=entity2, relationship_type=RelationshipType.ALLEGED
+        case=case, entity_id=alleged_id2, relationship_type=RelationshipType.ALLEGED
     )
     CaseEntityRelationship.objects.create(
-        case=case, entity=entity3, relationship_type=RelationshipType.RELATED
+        case=case, entity_id=related_id, relationship_type=RelationshipType.RELATED
     )
 
-    client = APIClient()
-    response = client.get("/api/entities/")
+    response = api_client.get("/api/entities/")
 
     assert response.status_code == 200
     assert response.data["count"] >= 3
 
     # Verify all entities are in results
-    entity_ids = [e["id"] for e in response.data["results"]]
-    assert entity1.id in entity_ids
-    assert entity2.id in entity_ids
-    assert entity3.id in entity_ids
+    entity_ids = {e["id"] for e in response.data["results"]}
+    assert {alleged_id1, alleged_id2, related_id} <= entity_ids
 
 
 @pytest.mark.django_db
-def test_entity_retrieve_endpoint():
+def test_entity_retrieve_endpoint(api_client):
     """Test that individual entities can be retrieved."""
     entity = JawafEntity.objects.create(nes_id="entity:person/test-person")
 
-    client = APIClient()
-    response = client.get(f"/api/entities/{entity.id}/")
+    response = api_client.get(f"/api/entities/{entity.id}/")
 
     assert response.status_code == 200
     assert response.data["id"] == entity.id
@@ -128,14 +105,13 @@ def test_entity_retrieve_endpoint():
 
 
 @pytest.mark.django_db
-def test_entity_retrieve_with_display_name():
+def test_entity_retrieve_with_display_name(api_client):
     """Test retrieving entity with display_name."""
     entity = JawafEntity.objects.create(
         nes_id="entity:person/john-doe", display_name="John Doe"
     )
 
-    client = APIClient()
-    response = client.get(f"/api/entities/{entity.id}/")
+    response = api_client.get(f"/api/entities/{entity.id}/")
 
     assert response.status_code == 200
     assert response.data["nes_id"] == "entity:person/john-doe"
@@ -143,12 +119,11 @@ def test_entity_retrieve_with_display_name():
 
 
 @pytest.mark.django_db
-def test_entity_retrieve_custom_entity():
+def test_entity_retrieve_custom_entity(api_client):
     """Test retrieving custom entity (no nes_id)."""
     entity = JawafEntity.objects.create(display_name="Custom Entity Name")
 
-    client = APIClient()
-    response = client.get(f"/api/entities/{entity.id}/")
+    response = api_client.get(f"/api/entities/{entity.id}/")
 
     assert response.status_code == 200
     assert response.data["nes_id"] is None
@@ -156,10 +131,9 @@ def test_entity_retrieve_custom_entity():
 
 
 @pytest.mark.django_db
-def test_entity_retrieve_nonexistent_returns_404():
+def test_entity_retrieve_nonexistent_returns_404(api_client):
     """Test that retrieving non-existent entity returns 404."""
-    client = APIClient()
-    response = client.get("/api/entities/99999/")
+    response = api_client.get("/api/entities/99999/")
 
     assert response.status_code == 404
 
@@ -170,7 +144,7 @@ def test_entity_retrieve_nonexistent_returns_404():
 
 
 @pytest.mark.django_db
-def test_entity_search_by_nes_id():
+def test_entity_search_by_nes_id(api_client):
     """Test searching entities by nes_id."""
     from cases.models import (
         JawafEntity,
@@ -197,8 +171,7 @@ def test_entity_search_by_nes_id():
         case=case, entity=entity3, relationship_type=RelationshipType.ALLEGED
     )
 
-    client = APIClient()
-    response = client.get("/api/entities/?search=john")
+    response = api_client.get("/api/entities/?search=john")
 
     assert response.status_code == 200
     assert response.data["count"] >= 2  # Should find john-doe and John Williams
@@ -209,7 +182,7 @@ def test_entity_search_by_nes_id():
 
 
 @pytest.mark.django_db
-def test_entity_search_by_display_name():
+def test_entity_search_by_display_name(api_client):
     """Test searching entities by display_name."""
     from cases.models import (
         JawafEntity,
@@ -236,8 +209,7 @@ def test_entity_search_by_display_name():
         case=case, entity=entity3, relationship_type=RelationshipType.ALLEGED
     )
 
-    client = APIClient()
-    response = client.get("/api/entities/?search=Jane")
+    response = api_client.get("/api/entities/?search=Jane")
 
     assert response.status_code == 200
     assert response.data["count"] >= 1
@@ -248,7 +220,7 @@ def test_entity_search_by_display_name():
 
 
 @pytest.mark.django_db
-def test_entity_search_case_insensitive():
+def test_entity_search_case_insensitive(api_client):
     """Test that entity search is case-insensitive."""
     from cases.models import (
         JawafEntity,
@@ -267,26 +239,23 @@ def test_entity_search_case_insensitive():
         case=case, entity=entity, relationship_type=RelationshipType.ALLEGED
     )
 
-    client = APIClient()
-
     # Search with lowercase
-    response1 = client.get("/api/entities/?search=test")
+    response1 = api_client.get("/api/entities/?search=test")
     assert response1.status_code == 200
     assert response1.data["count"] >= 1
 
     # Search with uppercase
-    response2 = client.get("/api/entities/?search=TEST")
+    response2 = api_client.get("/api/entities/?search=TEST")
     assert response2.status_code == 200
     assert response2.data["count"] >= 1
 
 
 @pytest.mark.django_db
-def test_entity_search_no_results():
+def test_entity_search_no_results(api_client):
     """Test that search with no matches returns empty results."""
     JawafEntity.objects.create(nes_id="entity:person/test-person")
 
-    client = APIClient()
-    response = client.get("/api/entities/?search=nonexistent")
+    response = api_client.get("/api/entities/?search=nonexistent")
 
     assert response.status_code == 200
     assert response.data["count"] == 0
@@ -299,16 +268,16 @@ def test_entity_search_no_results():
 
 
 @pytest.mark.django_db
-def test_entity_list_pagination():
+def test_entity_list_pagination(api_client):
     """Test that entity list is paginated."""
     from cases.models import (
         JawafEntity,
     )
 
     # Create more than 50 entities (default page size)
-    entities = []
-    for i in range(60):
-        entities.append(JawafEntity.objects.create(display_name=f"Entity {i}"))
+    entities = JawafEntity.objects.bulk_create(
+        JawafEntity(display_name=f"Entity {i}") for i in range(60)
+    )
 
     # Create published case with all entities
     case = Case.objects.create(
@@ -317,15 +286,14 @@ def test_entity_list_pagination():
         title="Test Case",
         description="Test",
     )
-    [
-        CaseEntityRelationship.objects.create(
+    CaseEntityRelationship.objects.bulk_create(
+        CaseEntityRelationship(
             case=case, entity=_e, relationship_type=RelationshipType.ALLEGED
         )
         for _e in entities
-    ]
+    )
 
-    client = APIClient()
-    response = client.get("/api/entities/")
+    response = api_client.get("/api/entities/")
 
     assert response.status_code == 200
     assert response.data["count"] >= 60
@@ -335,16 +303,16 @@ def test_entity_list_pagination():
 
 
 @pytest.mark.django_db
-def test_entity_list_pagination_navigation():
+def test_entity_list_pagination_navigation(api_client):
     """Test navigating through paginated entity results."""
     from cases.models import (
         JawafEntity,
     )
 
     # Create entities
-    entities = []
-    for i in range(60):
-        entities.append(JawafEntity.objects.create(display_name=f"Entity {i}"))
+    entities = JawafEntity.objects.bulk_create(
+        JawafEntity(display_name=f"Entity {i}") for i in range(60)
+    )
 
     # Create published case with all entities
     case = Case.objects.create(
@@ -353,27 +321,27 @@ def test_entity_list_pagination_navigation():
         title="Test Case",
         description="Test",
     )
-    [
-        CaseEntityRelationship.objects.create(
+    CaseEntityRelationship.objects.bulk_create(
+        CaseEntityRelationship(
             case=case, entity=_e, relationship_type=RelationshipType.ALLEGED
         )
         for _e in entities
-    ]
-
-    client = APIClient()
+    )
 
     # Get first page
-    response1 = client.get("/api/entities/")
+    response1 = api_client.get("/api/entities/")
     assert response1.status_code == 200
     page1_ids = [e["id"] for e in response1.data["results"]]
 
     # Get second page
-    response2 = client.get("/api/entities/?page=2")
+    response2 = api_client.get("/api/entities/?page=2")
     assert response2.status_code == 200
     page2_ids = [e["id"] for e in response2.data["results"]]
 
-    # Verify pages don't overlap
+    # Verify pages don't overlap and together cover every entity
+    assert len(page1_ids) == 50
     assert len(set(page1_ids) & set(page2_ids)) == 0
+    assert set(page1_ids) | set(page2_ids) == {e.id for e in entities}
 
 
 # ============================================================================
@@ -381,37 +349,50 @@ def test_entity_list_pagination_navigation():
 # ============================================================================
 
 
-@pytest.mark.django_db(transaction=True)
+@pytest.mark.django_db
 @settings(max_examples=20, derandomize=True)
 @given(nes_id=valid_entity_id())
 def test_entity_with_nes_id_accessible_via_api(nes_id):
     """
     Property: Any entity with a valid nes_id should be accessible via API.
+
+    Runs inside the regular test transaction; each example is rolled back to
+    a savepoint so examples stay isolated without a table flush per test. The
+    client is built per example because Hypothesis rejects function-scoped
+    fixtures such as api_client.
     """
-    # Use get_or_create to handle potential duplicates from previous test runs
-    entity, _ = JawafEntity.objects.get_or_create(nes_id=nes_id)
+    sid = transaction.savepoint()
+    try:
+        entity = JawafEntity.objects.create(nes_id=nes_id)
 
-    client = APIClient()
-    response = client.get(f"/api/entities/{entity.id}/")
+        response = APIClient().get(f"/api/entities/{entity.id}/")
 
-    assert response.status_code == 200
-    assert response.data["nes_id"] == nes_id
+        assert response.status_code == 200
+        assert response.data["nes_id"] == nes_id
+    finally:
+        transaction.savepoint_rollback(sid)
 
 
-@pytest.mark.django_db(transaction=True)
-@settings(max_examples=20)
-@given(display_name=st.text(min_size=1, max_size=100).filter(lambda x: x.strip()))
+@pytest.mark.django_db
+@settings(max_examples=20, derandomize=True)
+@given(display_name=_display_name)
 def test_entity_with_display_name_accessible_via_api(display_name):
     """
     Property: Any entity with a display_name should be accessible via API.
+
+    Examples are isolated with per-example savepoints and use a fresh client,
+    as in the nes_id test.
     """
-    entity = JawafEntity.objects.create(display_name=display_name)
+    sid = transaction.savepoint()
+    try:
+        entity = JawafEntity.objects.create(display_name=display_name)
 
-    client = APIClient()
-    response = client.get(f"/api/entities/{entity.id}/")
+        response = APIClient().get(f"/api/entities/{entity.id}/")
 
-    assert response.status_code == 200
-    assert response.data["display_name"] == display_name
+        assert response.status_code == 200
+        assert response.data["display_name"] == display_name
+    finally:
+        transaction.savepoint_rollback(sid)
 
 
 # ============================================================================
@@ -420,12 +401,11 @@ def test_entity_with_display_name_accessible_via_api(display_name):
 
 
 @pytest.mark.django_db
-def test_entity_list_response_structure():
+def test_entity_list_response_structure(api_client):
     """Test that entity list response has correct structure."""
     JawafEntity.objects.create(nes_id="entity:person/test")
 
-    client = APIClient()
-    response = client.get("/api/entities/")
+    response = api_client.get("/api/entities/")
 
     assert response.status_code == 200
 
@@ -444,14 +424,13 @@ def test_entity_list_response_structure():
 
 
 @pytest.mark.django_db
-def test_entity_retrieve_response_structure():
+def test_entity_retrieve_response_structure(api_client):
     """Test that entity retrieve response has correct structure."""
     entity = JawafEntity.objects.create(
         nes_id="entity:person/test", display_name="Test Person"
     )
 
-    client = APIClient()
-    response = client.get(f"/api/entities/{entity.id}/")
+    response = api_client.get(f"/api/entities/{entity.id}/")
 
     assert response.status_code == 200
 
@@ -475,7 +454,7 @@ def test_entity_retrieve_response_structure():
 class TestEntityAPIWorkflows:
     """End-to-end workflow tests for entity API."""
 
-    def test_browse_and_search_entities_workflow(self):
+    def test_browse_and_search_entities_workflow(self, api_client):
         """
         E2E Test: User browses entities and searches for specific ones.
 
@@ -510,33 +489,28 @@ class TestEntityAPIWorkflows:
             case=case, entity=entity3, relationship_type=RelationshipType.ALLEGED
         )
 
-        client = APIClient()
-
         # Step 1: List all entities
-        response = client.get("/api/entities/")
+        response = api_client.get("/api/entities/")
         assert response.status_code == 200
         assert response.data["count"] >= 3
 
         # Step 2: Search for specific entity
-        response = client.get("/api/entities/?search=rabi")
+        response = api_client.get("/api/entities/?search=rabi")
         assert response.status_code == 200
         assert response.data["count"] >= 1
 
-        found_entity = None
-        for entity in response.data["results"]:
-            if entity["id"] == entity1.id:
-                found_entity = entity
-                break
+        results_by_id = {entity["id"]: entity for entity in response.data["results"]}
+        found_entity = results_by_id.get(entity1.id)
 
         assert found_entity is not None
         assert "rabi" in found_entity["nes_id"].lower()
 
         # Step 3: Retrieve full entity details
-        response = client.get(f"/api/entities/{entity1.id}/")
+        response = api_client.get(f"/api/entities/{entity1.id}/")
         assert response.status_code == 200
         assert response.data["nes_id"] == "entity:person/rabi-lamichhane"
 
-    def test_pagination_workflow(self):
+    def test_pagination_workflow(self, api_client):
         """
         E2E Test: User navigates through paginated entity results.
 
@@ -551,10 +525,9 @@ class TestEntityAPIWorkflows:
         )
 
         # Setup: Create 60 entities
-        entities = []
-        for i in range(60):
-            entity = JawafEntity.objects.create(display_name=f"Entity {i:03d}")
-            entities.append(entity)
+        entities = JawafEntity.objects.bulk_create(
+            JawafEntity(display_name=f"Entity {i:03d}") for i in range(60)
+        )
 
         # Create published case with all entities
         case = Case.objects.create(
@@ -563,17 +536,15 @@ class TestEntityAPIWorkflows:
             title="Test Case",
             description="Test",
         )
-        [
-            CaseEntityRelationship.objects.create(
+        CaseEntityRelationship.objects.bulk_create(
+            CaseEntityRelationship(
                 case=case, entity=_e, relationship_type=RelationshipType.ALLEGED
             )
             for _e in entities
-        ]
-
-        client = APIClient()
+        )
 
         # Step 1: Get first page
-        response1 = client.get("/api/entities/")
+        response1 = api_client.get("/api/entities/")
         assert response1.status_code == 200
         assert response1.data["count"] >= 60
         page1_count = len(response1.data["results"])
@@ -581,7 +552,7 @@ class TestEntityAPIWorkflows:
 
         # Step 2: Navigate to next page
         if response1.data["next"]:
-            response2 = client.get("/api/entities/?page=2")
+            response2 = api_client.get("/api/entities/?page=2")
             assert response2.status_code == 200
             page2_count = len(response2.data["results"])
             assert page2_count > 0
@@ -6,7 +6,6 @@ Tests that entity endpoints return a single related_cases list with relation_typ
 """
 
 import pytest
-from rest_framework.test import APIClient
 
 from cases.models import (
     Case,
@@ -17,23 +16,12 @@ from cases.models import (
 )
 
 
-@pytest.fixture(autouse=True)
-def clear_cache():
-    """Clear cache before each test."""
-    from django.core.cache import cache
-
-    cache.clear()
-    yield
-    cache.clear()
-
-
 @pytest.mark.django_db
-def test_entity_detail_includes_related_cases_field():
+def test_entity_detail_includes_related_cases_field(api_client):
     """Entity detail should include unified related_cases list."""
     entity = JawafEntity.objects.create(nes_id="entity:person/test-person")
 
-    client = APIClient()
-    response = client.get(f"/api/entities/{entity.id}/")
+    response = api_client.get(f"/api/entities/{entity.id}/")
 
     assert response.status_code == 200
     assert "related_cases" in response.data
@@ -41,7 +29,7 @@ def test_entity_detail_includes_related_cases_field():
 
 
 @pytest.mark.django_db
-def test_entity_detail_related_cases_returns_relation_type_and_notes():
+def test_entity_detail_related_cases_returns_relation_type_and_notes(api_client):
     """Each related_cases entry should expose case id, relation type, and notes."""
     entity = JawafEntity.objects.create(nes_id="entity:person/test-person")
     case = Case.objects.create(
@@ -58,8 +46,7 @@ def test_entity_detail_related_cases_returns_relation_type_and_notes():
         notes="Named in CIAA filing",
     )
 
-    client = APIClient()
-    response = client.get(f"/api/entities/{entity.id}/")
+    response = api_client.get(f"/api/entities/{entity.id}/")
 
     assert response.status_code == 200
     assert response.data["related_cases"] == [
@@ -72,7 +59,7 @@ def test_entity_detail_related_cases_returns_relation_type_and_notes():
 
 
 @pytest.mark.django_db
-def test_entity_detail_includes_multiple_relationship_types_for_same_case():
+def test_entity_detail_includes_multiple_relationship_types_for_same_case(api_client):
     """A case can appear multiple times when relation types differ."""
     entity = JawafEntity.objects.create(nes_id="entity:person/test-person")
     case = Case.objects.create(
@@ -95,8 +82,7 @@ def test_entity_detail_includes_multiple_relationship_types_for_same_case():
         notes="Also linked via procurement committee",
     )
 
-    client = APIClient()
-    response = client.get(f"/api/entities/{entity.id}/")
+    response = api_client.get(f"/api/entities/{entity.id}/")
 
     assert response.status_code == 200
     assert len(response.data["related_cases"]) == 2
@@ -113,7 +99,7 @@ def test_entity_detail_includes_multiple_relationship_types_for_same_case():
 
 
 @pytest.mark.django_db
-def test_entity_detail_excludes_non_published_case_relationships():
+def test_entity_detail_excludes_non_published_case_relationships(api_client):
     """Only relationships from published cases should be returned."""
     entity = JawafEntity.objects.create(nes_id="entity:person/test-person")
 
@@ -141,8 +127,7 @@ def test_entity_detail_excludes_non_published_case_relationships():
         relationship_type=RelationshipType.ACCUSED,
     )
 
-    client = APIClient()
-    response = client.get(f"/api/entities/{entity.id}/")
+    response = api_client.get(f"/api/entities/{entity.id}/")
 
     assert response.status_code == 200
     assert response.data["related_cases"] == [
@@ -155,7 +140,7 @@ def test_entity_detail_excludes_non_published_case_relationships():
 
 
 @pytest.mark.django_db
-def test_entity_list_includes_unified_related_cases_field():
+def test_entity_list_includes_unified_related_cases_field(api_client):
     """Entity list endpoint should include the same related_cases structure."""
     entity = JawafEntity.objects.create(nes_id="entity:person/test-person")
     case = Case.objects.create(
@@ -171,14 +156,11 @@ def test_entity_list_includes_unified_related_cases_field():
         notes="Appeared during committee hearing",
     )
 
-    client = APIClient()
-    response = client.get("/api/entities/")
+    response = api_client.get("/api/entities/")
 
     assert response.status_code == 200
-    entity_data = next(
-        (item for item in response.data["results"] if item["id"] == entity.id),
-        None,
-    )
+    results_by_id = {item["id"]: item for item in response.data["results"]}
+    entity_data = results_by_id.get(entity.id)
     assert entity_data is not None, f"Entity {entity.id} not found in results"
 
     assert entity_data["related_cases"] == [
@@ -188,3 +170,33 @@ def test_entity_list_includes_unified_related_cases_field():
             "notes": "Appeared during committee hearing",
         }
     ]
+
+
+@pytest.mark.django_db
+def test_entity_list_query_count_does_not_grow_with_entities(
+    api_client, django_assert_max_num_queries
+):
+    """related_cases is prefetched, so the list costs a fixed number of queries."""
+    case = Case.objects.create(
+        case_id="case-001",
+        state=CaseState.PUBLISHED,
+        title="Test Case",
+        description="Test description",
+    )
+    entities = JawafEntity.objects.bulk_create(
+        JawafEntity(display_name=f"Entity {i}") for i in range(10)
+    )
+    CaseEntityRelationship.objects.bulk_create(
+        CaseEntityRelationship(
+            case=case, entity=entity, relationship_type=RelationshipType.ACCUSED
+        )
+        for entity in entities
+    )
+
+    # Cache-miss id lookup, COUNT, page, and the related_cases prefetch.
+    # A per-entity query in the serializer would push this over the bound.
+    with django_assert_max_num_queries(4):
+        response = api_client.get("/api/entities/")
+
+    assert response.status_code == 200
+    assert len(response.data["results"]) == 10
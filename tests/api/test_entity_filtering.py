@@ -5,9 +5,10 @@ Feature: Entity API should only return entities associated with published cases
 Tests that entities appear in alleged_entities or related_entities of published cases
 """
 
+from collections import Counter
+
 import pytest
 from django.core.cache import cache
-from rest_framework.test import APIClient
 
 from cases.models import (
     Case,
@@ -17,13 +18,7 @@ from cases.models import (
     RelationshipType,
 )
 
-
-@pytest.fixture(autouse=True)
-def clear_cache():
-    """Clear cache before each test."""
-    cache.clear()
-    yield
-    cache.clear()
+pytestmark = pytest.mark.django_db
 
 
 # ============================================================================
@@ -31,8 +26,9 @@ def clear_cache():
 # ============================================================================
 
 
-@pytest.mark.django_db
-def test_entity_list_only_returns_entities_in_published_cases():
+def test_entity_list_only_returns_entities_in_published_cases(
+    api_client, django_assert_max_num_queries
+):
     """Test that only entities associated with published cases are returned."""
     # Create entities
     entity_in_published = JawafEntity.objects.create(
@@ -69,13 +65,15 @@ def test_entity_list_only_returns_entities_in_published_cases():
         relationship_type=RelationshipType.ALLEGED,
     )
 
-    client = APIClient()
-    response = client.get("/api/entities/")
+    # Cache-miss id lookup, COUNT, page, and the related_cases prefetch.
+    # A per-entity query in the serializer would push this over the bound.
+    with django_assert_max_num_queries(4):
+        response = api_client.get("/api/entities/")
 
     assert response.status_code == 200
 
     # Extract entity IDs from response
-    entity_ids = [e["id"] for e in response.data["results"]]
+    entity_ids = {e["id"] for e in response.data["results"]}
 
     # Only entity in published case should be returned
     assert entity_in_published.id in entity_ids
@@ -83,104 +81,105 @@ def test_entity_list_only_returns_entities_in_published_cases():
     assert entity_not_in_cases.id not in entity_ids
 
 
-@pytest.mark.django_db
-def test_entity_in_alleged_entities_is_returned():
-    """Test that entities in alleged_entities are returned."""
-    entity = JawafEntity.objects.create(nes_id="entity:person/alleged")
-
-    case = Case.objects.create(
-        case_id="case-001",
-        state=CaseState.PUBLISHED,
-        title="Test Case",
-        description="Test",
-    )
-    CaseEntityRelationship.objects.create(
-        case=case, entity=entity, relationship_type=RelationshipType.ALLEGED
-    )
-
-    client = APIClient()
-    response = client.get("/api/entities/")
-
-    assert response.status_code == 200
-    entity_ids = [e["id"] for e in response.data["results"]]
-    assert entity.id in entity_ids
-
-
-@pytest.mark.django_db
-def test_entity_in_related_entities_is_returned():
-    """Test that entities in related_entities are returned."""
-    entity = JawafEntity.objects.create(nes_id="entity:person/related")
-
-    case = Case.objects.create(
-        case_id="case-001",
-        state=CaseState.PUBLISHED,
-        title="Test Case",
-        description="Test",
-    )
-    CaseEntityRelationship.objects.create(
-        case=case, entity=entity, relationship_type=RelationshipType.RELATED
-    )
-
-    client = APIClient()
-    response = client.get("/api/entities/")
-
-    assert response.status_code == 200
-    entity_ids = [e["id"] for e in response.data["results"]]
-    assert entity.id in entity_ids
-
+@pytest.mark.parametrize(
+    "nes_id, relationship_type, state, expected_present",
+    [
+        pytest.param(
+            "entity:person/alleged",
+            RelationshipType.ALLEGED,
+            CaseState.PUBLISHED,
+            True,
+            id="alleged-in-published",
+        ),
+        pytest.param(
+            "entity:person/related",
+            RelationshipType.RELATED,
+            CaseState.PUBLISHED,
+            True,
+            id="related-in-published",
+        ),
+        pytest.param(
+            "entity:location/test-location",
+            RelationshipType.RELATED,
+            CaseState.PUBLISHED,
+            False,
+            id="location-in-published",
+        ),
+        pytest.param(
+            "entity:person/draft",
+            RelationshipType.ALLEGED,
+            CaseState.DRAFT,
+            False,
+            id="alleged-in-draft",
+        ),
+        pytest.param(
+            "entity:person/closed",
+            RelationshipType.ALLEGED,
+            CaseState.CLOSED,
+            False,
+            id="alleged-in-closed",
+        ),
+    ],
+)
+def test_entity_list_inclusion(
+    api_client, nes_id, relationship_type, state, expected_present
+):
+    """
+    Entities are listed only via alleged/related links to published cases.
 
-@pytest.mark.django_db
-def test_entity_in_locations_is_not_returned():
-    """Test that entities in locations are NOT returned."""
-    entity = JawafEntity.objects.create(nes_id="entity:location/test-location")
+    Locations are never listed, and DRAFT/CLOSED cases expose no entities.
+    """
+    entity = JawafEntity.objects.create(nes_id=nes_id)
 
     case = Case.objects.create(
         case_id="case-001",
-        state=CaseState.PUBLISHED,
+        state=state,
         title="Test Case",
         description="Test",
     )
     CaseEntityRelationship.objects.create(
-        case=case, entity=entity, relationship_type=RelationshipType.RELATED
+        case=case, entity=entity, relationship_type=relationship_type
     )
 
-    client = APIClient()
-    response = client.get("/api/entities/")
+    response = api_client.get("/api/entities/")
 
     assert response.status_code == 200
-    entity_ids = [e["id"] for e in response.data["results"]]
-    assert entity.id not in entity_ids
+    entity_ids = {e["id"] for e in response.data["results"]}
+    assert (entity.id in entity_ids) is expected_present
 
 
-@pytest.mark.django_db
-def test_entity_in_multiple_cases_appears_once():
+def test_entity_in_multiple_cases_appears_once(api_client):
     """Test that entity appearing in multiple cases is returned only once."""
     entity = JawafEntity.objects.create(nes_id="entity:person/multi-case")
 
-    # Create multiple published cases with same entity
-    for i in range(3):
-        case = Case.objects.create(
+    # Create multiple published cases with same entity. Cases go through
+    # save() so published slugs are generated; the links are bulk-created.
+    cases = [
+        Case.objects.create(
             case_id=f"case-00{i}",
             state=CaseState.PUBLISHED,
             title=f"Case {i}",
             description="Test",
         )
-        CaseEntityRelationship.objects.create(
+        for i in range(3)
+    ]
+    CaseEntityRelationship.objects.bulk_create(
+        CaseEntityRelationship(
             case=case, entity=entity, relationship_type=RelationshipType.ALLEGED
         )
+        for case in cases
+    )
 
-    client = APIClient()
-    response = client.get("/api/entities/")
+    response = api_client.get("/api/entities/")
 
     assert response.status_code == 200
 
     # Count how many times entity appears
-    entity_count = sum(1 for e in response.data["results"] if e["id"] == entity.id)
-    assert entity_count == 1
+    id_counts = Counter(e["id"] for e in response.data["results"])
+    assert id_counts[entity.id] == 1
 
 
-@pytest.mark.django_db
-def test_entity_in_both_alleged_and_related_appears_once():
+def test_entity_in_both_alleged_and_related_appears_once(api_client):
     """Test that entity in both alleged and related appears only once."""
     entity = JawafEntity.objects.create(nes_id="entity:person/both")
 
@@ -197,18 +196,16 @@ def test_entity_in_both_alleged_and_related_appears_once():
         case=case, entity=entity, relationship_type=RelationshipType.RELATED
     )
 
-    client = APIClient()
-    response = client.get("/api/entities/")
+    response = api_client.get("/api/entities/")
 
     assert response.status_code == 200
 
     # Count how many times entity appears
-    entity_count = sum(1 for e in response.data["results"] if e["id"] == entity.id)
-    assert entity_count == 1
+    id_counts = Counter(e["id"] for e in response.data["results"])
+    assert id_counts[entity.id] == 1
 
 
-@pytest.mark.django_db
-def test_entity_list_excludes_in_review_cases():
+def test_entity_list_excludes_in_review_cases(api_client):
     """Test that IN_REVIEW cases are excluded from public entity list."""
 
     entity_in_review = JawafEntity.objects.create(nes_id="entity:person/in-review")
@@ -242,11 +239,10 @@ def test_entity_list_excludes_in_review_cases():
         relationship_type=RelationshipType.ALLEGED,
     )
 
-    client = APIClient()
-    response = client.get("/api/entities/")
+    response = api_client.get("/api/entities/")
 
     assert response.status_code == 200
-    entity_ids = [e["id"] for e in response.data["results"]]
+    entity_ids = {e["id"] for e in response.data["results"]}
 
     # Only published entity should be returned
     assert entity_in_review.id not in entity_ids
@@ -258,8 +254,7 @@ def test_entity_list_excludes_in_review_cases():
 # ============================================================================
 
 
-@pytest.mark.django_db
-def test_entity_list_uses_cache():
+def test_entity_list_uses_cache(api_client):
     """Test that entity list uses caching."""
     entity = JawafEntity.objects.create(nes_id="entity:person/test")
 
@@ -273,10 +268,8 @@ def test_entity_list_uses_cache():
         case=case, entity=entity, relationship_type=RelationshipType.ALLEGED
     )
 
-    client = APIClient()
-
     # First request - cache miss
-    response1 = client.get("/api/entities/")
+    response1 = api_client.get("/api/entities/")
     assert response1.status_code == 200
 
     # Verify cache was set
@@ -285,15 +278,14 @@ def test_entity_list_uses_cache():
     assert entity.id in cached_ids
 
     # Second request - cache hit
-    response2 = client.get("/api/entities/")
+    response2 = api_client.get("/api/entities/")
     assert response2.status_code == 200
 
     # Results should be the same
     assert response1.data["count"] == response2.data["count"]
 
 
-@pytest.mark.django_db
-def test_entity_list_cache_expires():
+def test_entity_list_cache_expires(api_client):
     """Test that cache expires after TTL."""
     entity = JawafEntity.objects.create(nes_id="entity:person/test")
 
@@ -307,10 +299,8 @@ def test_entity_list_cache_expires():
         case=case, entity=entity, relationship_type=RelationshipType.ALLEGED
     )
 
-    client = APIClient()
-
     # First request - populate cache
-    response1 = client.get("/api/entities/")
+    response1 = api_client.get("/api/entities/")
     assert response1.status_code == 200
 
     # Manually clear cache to simulate expiration
@@ -329,10 +319,10 @@ def test_entity_list_cache_expires():
     )
 
     # Second request - cache miss, should include new entity
-    response2 = client.get("/api/entities/")
+    response2 = api_client.get("/api/entities/")
     assert response2.status_code == 200
 
-    entity_ids = [e["id"] for e in response2.data["results"]]
+    entity_ids = {e["id"] for e in response2.data["results"]}
     assert new_entity.id in entity_ids
 
 
@@ -341,51 +331,24 @@ def test_entity_list_cache_expires():
 # ============================================================================
 
 
-@pytest.mark.django_db
-def test_entity_list_empty_when_no_published_cases():
+def test_entity_list_empty_when_no_published_cases(api_client):
     """Test that entity list is empty when there are no published cases."""
     # Create entities but no published cases
     JawafEntity.objects.create(nes_id="entity:person/test1")
     JawafEntity.objects.create(nes_id="entity:person/test2")
 
-    client = APIClient()
-    response = client.get("/api/entities/")
+    response = api_client.get("/api/entities/")
 
     assert response.status_code == 200
     assert response.data["count"] == 0
     assert len(response.data["results"]) == 0
 
 
-@pytest.mark.django_db
-def test_entity_list_excludes_closed_cases():
-    """Test that entities in CLOSED cases are not returned."""
-    entity = JawafEntity.objects.create(nes_id="entity:person/closed")
-
-    case = Case.objects.create(
-        case_id="case-001",
-        state=CaseState.CLOSED,
-        title="Closed Case",
-        description="Test",
-    )
-    CaseEntityRelationship.objects.create(
-        case=case, entity=entity, relationship_type=RelationshipType.ALLEGED
-    )
-
-    client = APIClient()
-    response = client.get("/api/entities/")
-
-    assert response.status_code == 200
-    entity_ids = [e["id"] for e in response.data["results"]]
-    assert entity.id not in entity_ids
-
-
-@pytest.mark.django_db
-def test_entity_retrieve_works_for_entity_not_in_published_cases():
+def test_entity_retrieve_works_for_entity_not_in_published_cases(api_client):
     """Test that individual entity retrieval works even if entity is not in published cases."""
     entity = JawafEntity.objects.create(nes_id="entity:person/standalone")
 
-    client = APIClient()
-    response = client.get(f"/api/entities/{entity.id}/")
+    response = api_client.get(f"/api/entities/{entity.id}/")
 
     # Retrieve should still work (only list is filtered)
     assert response.status_code == 200
@@ -10,28 +10,38 @@ from django.test import Client
 from django.urls import reverse
 
 
-@pytest.mark.django_db
-class TestOpenAPIDocumentation:
-    """Test OpenAPI schema and documentation endpoints."""
+@pytest.fixture(scope="module")
+def schema_response():
+    """
+    Fetch the generated OpenAPI schema once for the whole module.
 
-    def test_schema_endpoint_accessible(self):
-        """Test that the OpenAPI schema endpoint is accessible."""
-        client = Client()
-        response = client.get(reverse("schema"))
+    Requested as JSON (same document as the default YAML) so parsing uses the
+    stdlib json module instead of PyYAML.
+    """
+    return Client().get(reverse("schema"), {"format": "json"})
 
-        assert response.status_code == 200
-        assert "application/vnd.oai.openapi" in response["Content-Type"]
 
-    def test_schema_contains_api_info(self):
-        """Test that the schema contains proper API information."""
-        client = Client()
-        response = client.get(reverse("schema"))
+@pytest.fixture(scope="module")
+def schema(schema_response):
+    """The OpenAPI schema, parsed once."""
+    return schema_response.json()
+
+
+class TestOpenAPIDocumentation:
+    """
+    Test OpenAPI schema and documentation endpoints.
 
-        # Parse the YAML response
-        import yaml
+    Schema generation does not touch the database (viewsets short-circuit
+    get_queryset for drf-spectacular's fake views), so no django_db marker.
+    """
 
-        schema = yaml.safe_load(response.content)
+    def test_schema_endpoint_accessible(self, schema_response):
+        """Test that the OpenAPI schema endpoint is accessible."""
+        assert schema_response.status_code == 200
+        assert "application/vnd.oai.openapi" in schema_response["Content-Type"]
 
+    def test_schema_contains_api_info(self, schema):
+        """Test that the schema contains proper API information."""
         # Verify basic structure
         assert "openapi" in schema
         assert "info" in schema
@@ -43,15 +53,8 @@ class TestOpenAPIDocumentation:
         assert schema["info"]["version"] == "1.0.0"
         assert "description" in schema["info"]
 
-    def test_schema_contains_case_endpoints(self):
+    def test_schema_contains_case_endpoints(self, schema):
         """Test that the schema documents case endpoints."""
-        client = Client()
-        response = client.get(reverse("schema"))
-
-        import yaml
-
-        schema = yaml.safe_load(response.content)
-
         # Verify case endpoints are documented
         assert "/api/cases/" in schema["paths"]
         assert "/api/cases/{id}/" in schema["paths"]
@@ -76,28 +79,14 @@ class TestOpenAPIDocumentation:
         assert "search" in param_names
         assert "page" in param_names
 
-    def test_schema_contains_source_endpoints(self):
+    def test_schema_contains_source_endpoints(self, schema):
         """Test that the schema documents source endpoints."""
-        client = Client()
-        response = client.get(reverse("schema"))
-
-        import yaml
-
-        schema = yaml.safe_load(response.content)
-
         # Verify source endpoints are documented
         assert "/api/sources/" in schema["paths"]
         assert "/api/sources/{id}/" in schema["paths"]
 
-    def test_schema_contains_component_schemas(self):
+    def test_schema_contains_component_schemas(self, schema):
         """Test that the schema contains component definitions."""
-        client = Client()
-        response = client.get(reverse("schema"))
-
-        import yaml
-
-        schema = yaml.safe_load(response.content)
-
         # Verify component schemas exist
         assert "schemas" in schema["components"]
         assert "Case" in schema["components"]["schemas"]
@@ -114,23 +103,15 @@ class TestOpenAPIDocumentation:
         assert "evidence" in case_schema["properties"]
         assert "timeline" in case_schema["properties"]
 
-    def test_swagger_ui_accessible(self):
+    def test_swagger_ui_accessible(self, client):
         """Test that the Swagger UI is accessible."""
-        client = Client()
         response = client.get(reverse("swagger-ui"))
 
         assert response.status_code == 200
         assert "text/html" in response["Content-Type"]
 
-    def test_schema_has_tags(self):
+    def test_schema_has_tags(self, schema):
         """Test that the schema has proper tags for organization."""
-        client = Client()
-        response = client.get(reverse("schema"))
-
-        import yaml
-
-        schema = yaml.safe_load(response.content)
-
         # Verify endpoints are tagged
         cases_list = schema["paths"]["/api/cases/"]["get"]
         assert "tags" in cases_list
@@ -140,15 +121,8 @@ class TestOpenAPIDocumentation:
         assert "tags" in sources_list
         assert "sources" in sources_list["tags"]
 
-    def test_schema_documents_case_type_enum(self):
+    def test_schema_documents_case_type_enum(self, schema):
         """Test that the CaseType enum is properly documented."""
-        client = Client()
-        response = client.get(reverse("schema"))
-
-        import yaml
-
-        schema = yaml.safe_load(response.content)
-
         # Find CaseTypeEnum in components
         assert "CaseTypeEnum" in schema["components"]["schemas"]
         case_type_enum = schema["components"]["schemas"]["CaseTypeEnum"]
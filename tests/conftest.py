@@ -5,6 +5,8 @@ Ensures environment variables are set to their default values during testing.
 """
 
 import os
+import uuid
+
 import pytest
 
 # Set DATABASE_URL before Django settings are loaded so tests run without a
@@ -14,6 +16,8 @@ os.environ.setdefault("DATABASE_URL", "sqlite:///db.sqlite3")
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group, Permission
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db.models import Q
 from django.test import RequestFactory
 from hypothesis import settings as hypothesis_settings
 
@@ -27,6 +31,11 @@ from cases.models import (
 
 User = get_user_model()
 
+# RequestFactory keeps no state between requests, so one instance is shared by
+# the helpers below, the request_factory fixture and test modules that import
+# it directly.
+shared_request_factory = RequestFactory()
+
 
 def _is_ci() -> bool:
     """Return True when running in CI."""
@@ -83,11 +92,12 @@ def configure_test_settings():
     """
     from django.conf import settings as django_settings
 
-    # Disable static file manifest checking for tests.
-    # This prevents errors when static files haven't been collected.
+    # Keep uploaded files in memory so tests never write to MEDIA_ROOT, and
+    # disable static file manifest checking so tests don't depend on
+    # collectstatic having been run.
     django_settings.STORAGES = {
         "default": {
-            "BACKEND": "django.core.files.storage.FileSystemStorage",
+            "BACKEND": "django.core.files.storage.InMemoryStorage",
         },
         "staticfiles": {
             "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
@@ -101,10 +111,34 @@ def configure_test_settings():
     ]
 
 
+@pytest.fixture(autouse=True, scope="session")
+def prime_cache():
+    """
+    Empty the cache once before the first test of each session or worker.
+
+    LocMemCache already starts empty in every process, but a shared backend
+    (Redis, database cache) would carry entries over from an earlier run.
+    """
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(prime_cache):
+    """
+    Empty the cache after every test.
+
+    Cached entity ids, statistics and throttle history must not leak between
+    tests. prime_cache empties it before the first test, and every test
+    leaves it empty again, so clearing on teardown alone is enough.
+    """
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def request_factory():
-    """Create a Django RequestFactory for creating mock requests."""
-    return RequestFactory()
+    """Return the shared Django RequestFactory for creating mock requests."""
+    return shared_request_factory
 
 
 def create_mock_request(user, method="get", path="/"):
@@ -119,8 +153,7 @@ def create_mock_request(user, method="get", path="/"):
     Returns:
         Mock request object with user attached
     """
-    factory = RequestFactory()
-    request_method = getattr(factory, method.lower())
+    request_method = getattr(shared_request_factory, method.lower())
     request = request_method(path)
     request.user = user
     return request
@@ -130,9 +163,8 @@ def create_entities_from_ids(entity_ids):
     """
     Helper function to create JawafEntity objects from entity ID strings.
 
-    Uses bulk_create + a single filter query instead of N individual
-    get_or_create calls, keeping the same semantics at a fraction of the
-    database round-trips.
+    Uses one SELECT for the ids that already exist and one bulk INSERT for
+    the rest, keeping the same semantics as N get_or_create calls.
 
     Args:
         entity_ids: List of entity ID strings (e.g., ['entity:person/test'])
@@ -143,21 +175,21 @@ def create_entities_from_ids(entity_ids):
     if not entity_ids:
         return []
 
-    # Determine which ids already exist in one query to avoid re-saving them.
-    existing_ids = set(
-        JawafEntity.objects.filter(nes_id__in=entity_ids).values_list(
-            "nes_id", flat=True
-        )
-    )
-    # Save only new entities, going through full_clean() so that NES's
-    # validate_entity_id() runs and malformed ids are caught in tests.
-    for nid in entity_ids:
-        if nid not in existing_ids:
-            entity = JawafEntity(nes_id=nid)
-            entity.full_clean()
-            entity.save()
-    # Fetch all requested entities in a single query and preserve order.
     by_id = {e.nes_id: e for e in JawafEntity.objects.filter(nes_id__in=entity_ids)}
+
+    # Validate new entities through full_clean() so that NES's
+    # validate_entity_id() runs and malformed ids are caught in tests. The
+    # uniqueness and constraint checks would each cost a query and are
+    # already covered by the lookup above and by the database on insert.
+    new_entities = []
+    for nid in dict.fromkeys(entity_ids):
+        if nid not in by_id:
+            entity = JawafEntity(nes_id=nid)
+            entity.full_clean(validate_unique=False, validate_constraints=False)
+            new_entities.append(entity)
+    for entity in JawafEntity.objects.bulk_create(new_entities):
+        by_id[entity.nes_id] = entity
+
     return [by_id[nid] for nid in entity_ids]
 
 
@@ -184,26 +216,56 @@ def create_case_with_entities(**kwargs):
     # Create the case without entities
     case = Case.objects.create(**kwargs)
 
-    # Add entity relationships using CaseEntityRelationship
-    for nes_id in alleged_entity_ids:
-        entity, _ = JawafEntity.objects.get_or_create(nes_id=nes_id)
-        CaseEntityRelationship.objects.get_or_create(
-            case=case, entity=entity, relationship_type=RelationshipType.ACCUSED
-        )
-    for nes_id in related_entity_ids:
-        entity, _ = JawafEntity.objects.get_or_create(nes_id=nes_id)
-        CaseEntityRelationship.objects.get_or_create(
-            case=case, entity=entity, relationship_type=RelationshipType.RELATED
+    # Add entity relationships using CaseEntityRelationship. Locations are
+    # stored as related relationships.
+    typed_ids = (
+        [(nes_id, RelationshipType.ACCUSED) for nes_id in alleged_entity_ids]
+        + [(nes_id, RelationshipType.RELATED) for nes_id in related_entity_ids]
+        + [(nes_id, RelationshipType.RELATED) for nes_id in location_ids]
+    )
+    if typed_ids:
+        entities = create_entities_from_ids([nes_id for nes_id, _ in typed_ids])
+        # Drop repeated (entity, type) pairs, as get_or_create used to.
+        links = dict.fromkeys(
+            (entity, relationship_type)
+            for entity, (_, relationship_type) in zip(entities, typed_ids)
         )
-    for nes_id in location_ids:
-        entity, _ = JawafEntity.objects.get_or_create(nes_id=nes_id)
-        CaseEntityRelationship.objects.get_or_create(
-            case=case, entity=entity, relationship_type=RelationshipType.RELATED
+        CaseEntityRelationship.objects.bulk_create(
+            CaseEntityRelationship(
+                case=case, entity=entity, relationship_type=relationship_type
+            )
+            for entity, relationship_type in links
         )
 
     return case
 
 
+def bulk_create_cases_with_contributor(user, specs):
+    """
+    Create one Case per spec and assign user as a contributor on all of them.
+
+    Issues one INSERT for the cases and one for the contributor rows instead
+    of a save() and contributors.add() per case. bulk_create bypasses
+    Case.save(), so the case_id is generated here and slugs are left unset;
+    use create_case_with_entities when entity relationships are needed.
+
+    Args:
+        user: User to add as contributor
+        specs: Iterable of dicts of Case fields (title, case_type, state, ...)
+
+    Returns:
+        List of Case objects in the same order as specs
+    """
+    cases = Case.objects.bulk_create(
+        Case(case_id=f"case-{uuid.uuid4().hex[:12]}", **spec) for spec in specs
+    )
+    Contributor = Case.contributors.through
+    Contributor.objects.bulk_create(
+        Contributor(case_id=case.pk, user_id=user.pk) for case in cases
+    )
+    return cases
+
+
 def create_document_source_with_entities(**kwargs):
     """
     Helper function to create a DocumentSource with entity relationships.
@@ -226,9 +288,9 @@ def create_document_source_with_entities(**kwargs):
     # Create the source without entities
     source = DocumentSource.objects.create(**kwargs)
 
-    # Add entities using set()
+    # The source is new, so add() skips the existing-rows lookup set() does
     if related_entity_ids:
-        source.related_entities.set(create_entities_from_ids(related_entity_ids))
+        source.related_entities.add(*create_entities_from_ids(related_entity_ids))
 
     return source
 
@@ -272,36 +334,36 @@ def create_user_with_role(username, email, role, password="testpass123"):
     group, _ = Group.objects.get_or_create(name=role)
     user.groups.add(group)
 
-    # Set staff status for Admin, Moderator, and Contributor
+    # Set staff status for Admin, Moderator, and Contributor and superuser
+    # status for Admin, then write both flags in a single UPDATE.
     if role in ["Admin", "Moderator", "Contributor"]:
         user.is_staff = True
-        user.save()
-
-    # Set superuser status for Admin
     if role == "Admin":
         user.is_superuser = True
-        user.save()
+    if user.is_staff or user.is_superuser:
+        user.save(update_fields=["is_staff", "is_superuser"])
 
-    # Fetch all required permissions in two batched queries instead of 8+
-    # individual get_or_create calls.  Django creates standard model permissions
-    # during migrations so filter() is sufficient here.
+    # Fetch the role's permissions in one query and attach them with a single
+    # add() call. Django creates standard model permissions during migrations
+    # so filter() is sufficient here.
     case_ct = ContentType.objects.get_for_model(Case)
     user_ct = ContentType.objects.get_for_model(User)
 
-    case_perms = Permission.objects.filter(
-        codename__in=["view_case", "change_case", "add_case", "delete_case"],
-        content_type=case_ct,
-    )
-    user_perms = Permission.objects.filter(
-        codename__in=["view_user", "change_user", "add_user", "delete_user"],
-        content_type=user_ct,
-    )
-
+    permission_filter = Q()
     if role in ["Admin", "Moderator", "Contributor"]:
-        user.user_permissions.add(*case_perms)
+        permission_filter |= Q(
+            codename__in=["view_case", "change_case", "add_case", "delete_case"],
+            content_type=case_ct,
+        )
 
     # Moderators and Admins can manage users
     if role in ["Admin", "Moderator"]:
-        user.user_permissions.add(*user_perms)
+        permission_filter |= Q(
+            codename__in=["view_user", "change_user", "add_user", "delete_user"],
+            content_type=user_ct,
+        )
+
+    if permission_filter:
+        user.user_permissions.add(*Permission.objects.filter(permission_filter))
 
     return user
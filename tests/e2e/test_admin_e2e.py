@@ -10,7 +10,6 @@ import pytest
 
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
-from django.test import Client
 
 from cases.admin import CaseAdmin
 from cases.models import (
@@ -25,6 +24,7 @@ from tests.conftest import (
     create_case_with_entities,
     create_entities_from_ids,
     create_user_with_role,
+    shared_request_factory,
 )
 
 User = get_user_model()
@@ -58,9 +58,6 @@ class TestDjangoAdminWorkflows:
             "contributor2", "contributor2@example.com", "Contributor"
         )
 
-        # Create Django test client
-        self.client = Client()
-
     def test_create_draft_edit_submit_review_publish_workflow(self):
         """
         E2E Test: Complete case lifecycle from creation to publication.
@@ -125,10 +122,8 @@ class TestDjangoAdminWorkflows:
         # Step 4: Moderator reviews the case
         # Verify moderator can access the case
         admin_instance = CaseAdmin(Case, None)
-        from django.test import RequestFactory
 
-        factory = RequestFactory()
-        request = factory.get("/")
+        request = shared_request_factory.get("/")
         request.user = self.moderator
 
         queryset = admin_instance.get_queryset(request)
@@ -178,11 +173,8 @@ class TestDjangoAdminWorkflows:
 
         # Step 2: Verify contributor1 can access the case
         admin_instance = CaseAdmin(Case, None)
-        from django.test import RequestFactory
-
-        factory = RequestFactory()
 
-        request1 = factory.get("/")
+        request1 = shared_request_factory.get("/")
         request1.user = self.contributor1
 
         queryset1 = admin_instance.get_queryset(request1)
@@ -202,7 +194,7 @@ class TestDjangoAdminWorkflows:
         assert case.title == "Updated by Contributor1"
 
         # Step 3: Verify contributor2 cannot access the case
-        request2 = factory.get("/")
+        request2 = shared_request_factory.get("/")
         request2.user = self.contributor2
 
         queryset2 = admin_instance.get_queryset(request2)
@@ -245,11 +237,8 @@ class TestDjangoAdminWorkflows:
         """
         # Step 1: Contributor creates a new draft case via admin
         admin_instance = CaseAdmin(Case, None)
-        from django.test import RequestFactory
 
-        factory = RequestFactory()
-
-        request_contrib1 = factory.get("/")
+        request_contrib1 = shared_request_factory.get("/")
         request_contrib1.user = self.contributor1
 
         case = create_case_with_entities(
@@ -300,7 +289,7 @@ class TestDjangoAdminWorkflows:
         ), "Contributor should have change permission for their own case"
 
         # Step 5: Verify another contributor cannot see the case
-        request_contrib2 = factory.get("/")
+        request_contrib2 = shared_request_factory.get("/")
         request_contrib2.user = self.contributor2
 
         queryset2 = admin_instance.get_queryset(request_contrib2)
@@ -368,11 +357,9 @@ class TestDjangoAdminWorkflows:
         ), "Case should transition to IN_REVIEW with complete data"
 
         # Step 5: Contributor attempts to publish (should fail)
-        from django.test import RequestFactory
         from cases.admin import CaseAdminForm
 
-        factory = RequestFactory()
-        request_contrib = factory.post("/")
+        request_contrib = shared_request_factory.post("/")
         request_contrib.user = self.contributor1
 
         form_data = {
@@ -393,7 +380,7 @@ class TestDjangoAdminWorkflows:
         ), "Contributor should not be able to publish (Requirement 1.5)"
 
         # Step 6: Moderator successfully publishes
-        request_mod = factory.post("/")
+        request_mod = shared_request_factory.post("/")
         request_mod.user = self.moderator
 
         form_data["state"] = CaseState.PUBLISHED
@@ -557,11 +544,8 @@ class TestDjangoAdminWorkflows:
 
         # Step 2: Verify Admin can access all cases
         admin_instance = CaseAdmin(Case, None)
-        from django.test import RequestFactory
-
-        factory = RequestFactory()
 
-        request_admin = factory.get("/")
+        request_admin = shared_request_factory.get("/")
         request_admin.user = self.admin
 
         queryset = admin_instance.get_queryset(request_admin)
@@ -626,12 +610,9 @@ class TestDjangoAdminWorkflows:
 
         # Step 2: Verify moderator1 cannot see moderator2 in user queryset
         from cases.admin import CustomUserAdmin
-        from django.test import RequestFactory
 
         user_admin = CustomUserAdmin(User, None)
-        factory = RequestFactory()
-
-        request_mod = factory.get("/")
+        request_mod = shared_request_factory.get("/")
         request_mod.user = self.moderator
 
         user_queryset = user_admin.get_queryset(request_mod)
@@ -760,11 +741,9 @@ class TestDjangoAdminWorkflows:
         case.contributors.add(self.contributor1)
         case.save()
 
-        from django.test import RequestFactory
         from cases.admin import CaseAdminForm
 
-        factory = RequestFactory()
-        request_contrib = factory.post("/")
+        request_contrib = shared_request_factory.post("/")
         request_contrib.user = self.contributor1
 
         # Step 2: Contributor transitions DRAFT → IN_REVIEW (allowed)
@@ -881,7 +860,7 @@ class TestDjangoAdminWorkflows:
             deleted_source not in active_sources
         ), "Deleted source should not appear in active sources filter"
 
-    def test_contributor_login_create_minimal_case_and_view_workflow(self):
+    def test_contributor_login_create_minimal_case_and_view_workflow(self, client):
         """
         E2E Test: Contributor logs in, creates a minimal case, and sees it in their list.
 
@@ -897,24 +876,19 @@ class TestDjangoAdminWorkflows:
         Validates: Requirements 1.1, 3.1, 3.2
         """
         # Step 1: Contributor logs into Django Admin
-        login_success = self.client.login(
-            username="contributor1", password="testpass123"
-        )
+        login_success = client.login(username="contributor1", password="testpass123")
         assert login_success, "Contributor should be able to log in"
 
         # Verify contributor can access admin
-        response = self.client.get("/admin/")
+        response = client.get("/admin/")
         assert (
             response.status_code == 200
         ), "Contributor should be able to access admin interface"
 
         # Step 2: Contributor creates a new case with minimal data (title + case type)
         admin_instance = CaseAdmin(Case, None)
-        from django.test import RequestFactory
-
-        factory = RequestFactory()
 
-        request_contrib = factory.post("/admin/cases/case/add/")
+        request_contrib = shared_request_factory.post("/admin/cases/case/add/")
         request_contrib.user = self.contributor1
 
         # Create minimal case - only title and case type required
@@ -949,7 +923,7 @@ class TestDjangoAdminWorkflows:
         ), "Creator should be automatically assigned as contributor"
 
         # Step 5: Contributor views their case list
-        request_list = factory.get("/admin/cases/case/")
+        request_list = shared_request_factory.get("/admin/cases/case/")
         request_list.user = self.contributor1
 
         queryset = admin_instance.get_queryset(request_list)
@@ -981,13 +955,13 @@ class TestDjangoAdminWorkflows:
         ), "Contributor should have change permission for their own case"
 
         # Verify case details are accessible
-        response = self.client.get(f"/admin/cases/case/{minimal_case.id}/change/")
+        response = client.get(f"/admin/cases/case/{minimal_case.id}/change/")
         assert (
             response.status_code == 200
         ), "Contributor should be able to access case detail page"
 
         # Verify other contributor cannot see this case
-        request_other = factory.get("/admin/cases/case/")
+        request_other = shared_request_factory.get("/admin/cases/case/")
         request_other.user = self.contributor2
 
         queryset_other = admin_instance.get_queryset(request_other)
@@ -1015,11 +989,9 @@ class TestDjangoAdminWorkflows:
 
         Validates: Requirements 1.1
         """
-        from django.test import RequestFactory
         from cases.admin import CaseAdminForm
 
-        factory = RequestFactory()
-        request_contrib = factory.post("/admin/cases/case/add/")
+        request_contrib = shared_request_factory.post("/admin/cases/case/add/")
         request_contrib.user = self.contributor1
 
         entities = create_entities_from_ids(["entity:person/test"])
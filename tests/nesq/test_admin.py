@@ -18,7 +18,9 @@ See .kiro/specs/nes-queue-system/tasks.md §10.6 for requirements.
 import pytest
 
 from django.contrib.admin.sites import AdminSite
+from django.urls import reverse
 from django.utils import timezone
+from pytest_django.asserts import assertContains
 
 from nesq.admin import NESQueueItemAdmin
 from nesq.models import NESQueueItem, QueueAction, QueueStatus
@@ -88,9 +90,13 @@ def _make_admin_request(user):
 # ============================================================================
 
 
-@pytest.mark.django_db
 class TestAdminListView:
-    """Test that the admin list view displays queue items correctly."""
+    """
+    Test that the admin list view displays queue items correctly.
+
+    The attribute checks on the ModelAdmin skip the database fixture; a
+    single changelist request covers the rendered rows end to end.
+    """
 
     def test_list_display_contains_expected_columns(self, nesq_admin):
         """list_display should include id, action, status_badge, submitted_by, reviewed_by, created_at."""
@@ -115,6 +121,25 @@ class TestAdminListView:
             "submitted_by__username",
         ) == nesq_admin.search_fields
 
+    @pytest.mark.django_db
+    def test_changelist_renders_queue_items(self, client, admin_user, contributor_user):
+        """The changelist loads for an admin and renders one row per item."""
+        pending = _make_queue_item(contributor_user)
+        failed = _make_queue_item(contributor_user, status=QueueStatus.FAILED)
+        client.force_login(admin_user)
+
+        response = client.get(reverse("admin:nesq_nesqueueitem_changelist"))
+
+        assert response.status_code == 200
+        assert list(response.context["cl"].result_list) == [pending, failed]
+        for item in (pending, failed):
+            assertContains(
+                response, reverse("admin:nesq_nesqueueitem_change", args=[item.pk])
+            )
+        # Status badges, by colour; the status filter repeats the labels.
+        assertContains(response, "background-color: #ffc107", count=1)
+        assertContains(response, "background-color: #dc3545", count=1)
+
 
 # ============================================================================
 # Status badge rendering
@@ -16,7 +16,7 @@ See .kiro/specs/nes-queue-system/tasks.md §8 for requirements.
 """
 
 from io import StringIO
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -25,6 +25,23 @@ from django.core.management.base import CommandError
 
 from nesq.processor import ProcessingResult
 
+
+@pytest.fixture
+def mock_processor(monkeypatch, settings, tmp_path):
+    """
+    Point NES_DB_PATH at a real directory and stub out QueueProcessor.
+
+    Returns the stubbed class; tests configure
+    ``mock_processor.return_value.process_approved_items`` as needed.
+    """
+    settings.NES_DB_PATH = str(tmp_path)
+    processor_cls = MagicMock()
+    monkeypatch.setattr(
+        "nesq.management.commands.process_queue.QueueProcessor", processor_cls
+    )
+    return processor_cls
+
+
 # ============================================================================
 # NES_DB_PATH validation
 # ============================================================================
@@ -72,12 +89,9 @@ class TestNesDbPathValidation:
 class TestProcessQueueSuccess:
     """Test successful command execution scenarios."""
 
-    @patch("nesq.management.commands.process_queue.QueueProcessor")
-    def test_no_items_to_process(self, MockProcessor, settings, tmp_path):
+    def test_no_items_to_process(self, mock_processor):
         """When no approved items exist, should print notice message."""
-        settings.NES_DB_PATH = str(tmp_path)
-
-        mock_instance = MockProcessor.return_value
+        mock_instance = mock_processor.return_value
         mock_instance.process_approved_items = AsyncMock(
             return_value=ProcessingResult(processed=0, completed=0, failed=0)
         )
@@ -88,12 +102,9 @@ class TestProcessQueueSuccess:
         output = out.getvalue()
         assert "No approved items to process" in output
 
-    @patch("nesq.management.commands.process_queue.QueueProcessor")
-    def test_all_items_completed(self, MockProcessor, settings, tmp_path):
+    def test_all_items_completed(self, mock_processor):
         """When all items complete, should print success message."""
-        settings.NES_DB_PATH = str(tmp_path)
-
-        mock_instance = MockProcessor.return_value
+        mock_instance = mock_processor.return_value
         mock_instance.process_approved_items = AsyncMock(
             return_value=ProcessingResult(processed=3, completed=3, failed=0)
         )
@@ -106,19 +117,16 @@ class TestProcessQueueSuccess:
         assert "3 completed" in output
         assert "0 failed" in output
 
-    @patch("nesq.management.commands.process_queue.QueueProcessor")
-    def test_processor_receives_nes_db_path(self, MockProcessor, settings, tmp_path):
+    def test_processor_receives_nes_db_path(self, mock_processor, tmp_path):
         """QueueProcessor should be instantiated with the correct nes_db_path."""
-        settings.NES_DB_PATH = str(tmp_path)
-
-        mock_instance = MockProcessor.return_value
+        mock_instance = mock_processor.return_value
         mock_instance.process_approved_items = AsyncMock(
             return_value=ProcessingResult()
         )
 
         call_command("process_queue")
 
-        MockProcessor.assert_called_once_with(nes_db_path=str(tmp_path))
+        mock_processor.assert_called_once_with(nes_db_path=str(tmp_path))
 
 
 # ============================================================================
@@ -129,12 +137,9 @@ class TestProcessQueueSuccess:
 class TestProcessQueueFailures:
     """Test command behavior when items fail."""
 
-    @patch("nesq.management.commands.process_queue.QueueProcessor")
-    def test_partial_failure_prints_warning(self, MockProcessor, settings, tmp_path):
+    def test_partial_failure_prints_warning(self, mock_processor):
         """When some items fail, should print warning (not success)."""
-        settings.NES_DB_PATH = str(tmp_path)
-
-        mock_instance = MockProcessor.return_value
+        mock_instance = mock_processor.return_value
         mock_instance.process_approved_items = AsyncMock(
             return_value=ProcessingResult(
                 processed=3,
@@ -151,12 +156,9 @@ class TestProcessQueueFailures:
         assert "2 completed" in output
         assert "1 failed" in output
 
-    @patch("nesq.management.commands.process_queue.QueueProcessor")
-    def test_all_items_failed_exits_nonzero(self, MockProcessor, settings, tmp_path):
+    def test_all_items_failed_exits_nonzero(self, mock_processor):
         """When ALL items fail (0 completed), command should exit with code 1."""
-        settings.NES_DB_PATH = str(tmp_path)
-
-        mock_instance = MockProcessor.return_value
+        mock_instance = mock_processor.return_value
         mock_instance.process_approved_items = AsyncMock(
             return_value=ProcessingResult(
                 processed=2,
@@ -172,14 +174,9 @@ class TestProcessQueueFailures:
         with pytest.raises(SystemExit, match="1"):
             call_command("process_queue")
 
-    @patch("nesq.management.commands.process_queue.QueueProcessor")
-    def test_critical_processor_error_raises_command_error(
-        self, MockProcessor, settings, tmp_path
-    ):
+    def test_critical_processor_error_raises_command_error(self, mock_processor):
         """If processor.process_approved_items() raises, should raise CommandError."""
-        settings.NES_DB_PATH = str(tmp_path)
-
-        mock_instance = MockProcessor.return_value
+        mock_instance = mock_processor.return_value
         mock_instance.process_approved_items = AsyncMock(
             side_effect=RuntimeError("Database connection lost")
         )
@@ -196,12 +193,9 @@ class TestProcessQueueFailures:
 class TestVerboseFlag:
     """Test the --verbose command option."""
 
-    @patch("nesq.management.commands.process_queue.QueueProcessor")
-    def test_verbose_prints_db_path(self, MockProcessor, settings, tmp_path):
+    def test_verbose_prints_db_path(self, mock_processor, tmp_path):
         """With --verbose, should print the NES database path."""
-        settings.NES_DB_PATH = str(tmp_path)
-
-        mock_instance = MockProcessor.return_value
+        mock_instance = mock_processor.return_value
         mock_instance.process_approved_items = AsyncMock(
             return_value=ProcessingResult()
         )
@@ -212,12 +206,9 @@ class TestVerboseFlag:
         output = out.getvalue()
         assert str(tmp_path) in output
 
-    @patch("nesq.management.commands.process_queue.QueueProcessor")
-    def test_verbose_prints_error_details(self, MockProcessor, settings, tmp_path):
+    def test_verbose_prints_error_details(self, mock_processor):
         """With --verbose and failures, should print error details to stderr."""
-        settings.NES_DB_PATH = str(tmp_path)
-
-        mock_instance = MockProcessor.return_value
+        mock_instance = mock_processor.return_value
         mock_instance.process_approved_items = AsyncMock(
             return_value=ProcessingResult(
                 processed=1,
@@ -237,14 +228,9 @@ class TestVerboseFlag:
         assert "NESQ-99" in error_output
         assert "Entity 'xyz' not found" in error_output
 
-    @patch("nesq.management.commands.process_queue.QueueProcessor")
-    def test_no_verbose_suppresses_error_details(
-        self, MockProcessor, settings, tmp_path
-    ):
+    def test_no_verbose_suppresses_error_details(self, mock_processor):
         """Without --verbose, error details should NOT be printed to stderr."""
-        settings.NES_DB_PATH = str(tmp_path)
-
-        mock_instance = MockProcessor.return_value
+        mock_instance = mock_processor.return_value
         mock_instance.process_approved_items = AsyncMock(
             return_value=ProcessingResult(
                 processed=1,
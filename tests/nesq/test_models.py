@@ -450,17 +450,31 @@ class TestOrdering:
 class TestIndexes:
     """Tests for database indexes defined in Meta."""
 
-    def test_status_index_exists(self):
-        """There should be an index on the status field."""
-        index_names = [idx.name for idx in NESQueueItem._meta.indexes]
-        assert "nesq_status_idx" in index_names
+    def test_status_lookups_are_indexed(self):
+        """Status filters should be served by an index that leads with status."""
+        assert any(idx.fields[0] == "status" for idx in NESQueueItem._meta.indexes)
 
-    def test_status_index_fields(self):
-        """The status index should cover exactly the status field."""
+    def test_no_redundant_status_index(self):
+        """A status-only index would duplicate the (status, created_at) prefix."""
+        assert ["status"] not in [idx.fields for idx in NESQueueItem._meta.indexes]
+
+    def test_status_created_index_fields(self):
+        """The processor/admin index should cover status then created_at."""
+        idx = next(
+            idx
+            for idx in NESQueueItem._meta.indexes
+            if idx.name == "nesq_status_created_idx"
+        )
+        assert idx.fields == ["status", "created_at"]
+
+    def test_submitter_created_index_fields(self):
+        """The submissions index should cover submitter then newest-first date."""
         idx = next(
-            idx for idx in NESQueueItem._meta.indexes if idx.name == "nesq_status_idx"
+            idx
+            for idx in NESQueueItem._meta.indexes
+            if idx.name == "nesq_submitter_created_idx"
         )
-        assert idx.fields == ["status"]
+        assert idx.fields == ["submitted_by", "-created_at"]
 
 
 # ============================================================================
@@ -1,7 +1,6 @@
 import pytest
 from django.contrib.auth.models import Group
 from django.contrib.auth import get_user_model
-from django.core.cache import cache
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
 
@@ -23,14 +22,6 @@ def api_client():
     return APIClient()
 
 
-@pytest.fixture
-def clear_cache():
-    """Clear cache before and after each test to prevent throttle carryover."""
-    cache.clear()
-    yield
-    cache.clear()
-
-
 @pytest.fixture
 def authenticated_user(db):
     user = User.objects.create_user(username="ngm_user", password="testpass123")
@@ -7,17 +7,31 @@ Validates: Requirements 1.5, 3.1
 
 import pytest
 
+from auditlog.context import disable_auditlog
 from django.contrib.admin.sites import AdminSite
 
 from cases.admin import CaseAdmin
 from cases.models import Case, CaseType, CaseState
 from tests.conftest import (
+    bulk_create_cases_with_contributor,
     create_case_with_entities,
     create_user_with_role,
     create_mock_request,
 )
 
 
+@pytest.fixture(autouse=True)
+def no_auditlog():
+    """
+    Skip auditlog's post_save LogEntry writes for every case save here.
+
+    None of these tests assert on the audit trail, so the extra ContentType
+    lookup and LogEntry INSERT per saved row are pure setup overhead.
+    """
+    with disable_auditlog():
+        yield
+
+
 @pytest.fixture
 def contributor_user(db):
     """Create a contributor user with proper permissions."""
@@ -30,9 +44,9 @@ def another_contributor(db):
     return create_user_with_role("anothercontrib", "another@test.com", "Contributor")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def case_admin():
-    """Create a CaseAdmin instance."""
+    """Create a CaseAdmin instance shared by the module; it holds no per-test state."""
     return CaseAdmin(Case, AdminSite())
 
 
@@ -75,10 +89,6 @@ def test_creator_automatically_added_to_contributors(contributor_user, case_admi
         id=contributor_user.id
     ).exists(), "Creator should be automatically added to contributors"
 
-    assert (
-        contributor_user in case.contributors.all()
-    ), "Creator should be in the contributors list"
-
 
 @pytest.mark.django_db
 def test_creator_has_view_permission(contributor_user, case_admin):
@@ -171,7 +181,7 @@ def test_non_creator_contributor_cannot_access(
 
 @pytest.mark.django_db
 def test_creator_can_see_case_in_queryset(
-    contributor_user, another_contributor, case_admin
+    contributor_user, another_contributor, case_admin, django_assert_num_queries
 ):
     """
     Test that the creator can see their case in the admin queryset.
@@ -180,41 +190,50 @@ def test_creator_can_see_case_in_queryset(
     """
 
     # Create cases by different contributors
-    case1 = create_case_with_entities(
-        title="Case by Contributor 1",
-        case_type=CaseType.CORRUPTION,
-        alleged_entities=["entity:person/test-person"],
-        state=CaseState.DRAFT,
+    (case1,) = bulk_create_cases_with_contributor(
+        contributor_user,
+        [
+            {
+                "title": "Case by Contributor 1",
+                "case_type": CaseType.CORRUPTION,
+                "state": CaseState.DRAFT,
+            }
+        ],
     )
-    case1.contributors.add(contributor_user)
-
-    case2 = create_case_with_entities(
-        title="Case by Another Contributor",
-        case_type=CaseType.CORRUPTION,
-        alleged_entities=["entity:person/test-person"],
-        state=CaseState.DRAFT,
+    (case2,) = bulk_create_cases_with_contributor(
+        another_contributor,
+        [
+            {
+                "title": "Case by Another Contributor",
+                "case_type": CaseType.CORRUPTION,
+                "state": CaseState.DRAFT,
+            }
+        ],
     )
-    case2.contributors.add(another_contributor)
 
     # Get queryset for first contributor
     request = create_mock_request(contributor_user)
 
-    queryset = case_admin.get_queryset(request)
+    # Two role checks plus one SELECT; contributors must not be loaded per case
+    with django_assert_num_queries(3):
+        results = list(case_admin.get_queryset(request))
 
     # Should only see their own case
-    assert case1 in queryset, "Creator should see their own case in queryset"
+    assert case1 in results, "Creator should see their own case in queryset"
 
     assert (
-        case2 not in queryset
+        case2 not in results
     ), "Creator should NOT see other contributors' cases in queryset"
 
     assert (
-        queryset.count() == 1
-    ), f"Creator should see exactly 1 case, but saw {queryset.count()}"
+        len(results) == 1
+    ), f"Creator should see exactly 1 case, but saw {len(results)}"
 
 
 @pytest.mark.django_db
-def test_multiple_cases_by_same_creator(contributor_user, case_admin):
+def test_multiple_cases_by_same_creator(
+    contributor_user, case_admin, django_assert_num_queries
+):
     """
     Test that a creator can access all cases they created.
 
@@ -222,43 +241,42 @@ def test_multiple_cases_by_same_creator(contributor_user, case_admin):
     """
 
     # Create multiple cases
-    case1 = create_case_with_entities(
-        title="Case 1",
-        case_type=CaseType.CORRUPTION,
-        alleged_entities=["entity:person/test-person"],
-        state=CaseState.DRAFT,
-    )
-    case1.contributors.add(contributor_user)
-
-    case2 = create_case_with_entities(
-        title="Case 2",
-        case_type=CaseType.PROMISES,
-        alleged_entities=["entity:person/test-person"],
-        state=CaseState.DRAFT,
+    case1, case2, case3 = bulk_create_cases_with_contributor(
+        contributor_user,
+        [
+            {
+                "title": "Case 1",
+                "case_type": CaseType.CORRUPTION,
+                "state": CaseState.DRAFT,
+            },
+            {
+                "title": "Case 2",
+                "case_type": CaseType.PROMISES,
+                "state": CaseState.DRAFT,
+            },
+            {
+                "title": "Case 3",
+                "case_type": CaseType.CORRUPTION,
+                "state": CaseState.IN_REVIEW,
+            },
+        ],
     )
-    case2.contributors.add(contributor_user)
-
-    case3 = create_case_with_entities(
-        title="Case 3",
-        case_type=CaseType.CORRUPTION,
-        alleged_entities=["entity:person/test-person"],
-        state=CaseState.IN_REVIEW,
-    )
-    case3.contributors.add(contributor_user)
 
     # Get queryset for contributor
     request = create_mock_request(contributor_user)
 
-    queryset = case_admin.get_queryset(request)
+    # Two role checks plus one SELECT; contributors must not be loaded per case
+    with django_assert_num_queries(3):
+        results = list(case_admin.get_queryset(request))
 
     # Should see all their cases
     assert (
-        queryset.count() == 3
-    ), f"Creator should see all 3 of their cases, but saw {queryset.count()}"
+        len(results) == 3
+    ), f"Creator should see all 3 of their cases, but saw {len(results)}"
 
-    assert case1 in queryset, "Creator should see case 1"
-    assert case2 in queryset, "Creator should see case 2"
-    assert case3 in queryset, "Creator should see case 3"
+    assert case1 in results, "Creator should see case 1"
+    assert case2 in results, "Creator should see case 2"
+    assert case3 in results, "Creator should see case 3"
 
 
 @pytest.mark.django_db
@@ -298,6 +316,6 @@ def test_creator_access_persists_after_state_change(contributor_user, case_admin
     ), "Creator should still have access in IN_REVIEW state"
 
     # Verify contributor is still in the list
-    assert (
-        contributor_user in case.contributors.all()
-    ), "Creator should still be in contributors after state change"
+    assert case.contributors.filter(
+        id=contributor_user.id
+    ).exists(), "Creator should still be in contributors after state change"
@@ -6,13 +6,15 @@ Property 11: Source validation enforces required fields
 Validates: Requirements 4.2
 """
 
+from types import SimpleNamespace
+
 import pytest
 
 from django.core.exceptions import ValidationError
 from hypothesis import given, settings
 
 from cases.models import DocumentSource
-from cases.models import SourceType
+from cases.models import SourceType, validate_upload_file_extension
 from tests.conftest import create_document_source_with_entities
 from tests.strategies import (
     valid_source_data,
@@ -279,3 +281,25 @@ def test_media_news_source_accepts_valid_publication_date():
     source.save()
     source.refresh_from_db()
     assert source.publication_date == datetime.date(2024, 3, 15)
+
+
+# ============================================================================
+# Upload extension validation
+# ============================================================================
+
+
+@pytest.mark.parametrize(
+    "filename", ["report.pdf", "Scan.JPG", "notes.tar.md", "ruling.docx"]
+)
+def test_upload_extension_validator_accepts_allowed_extensions(filename):
+    """Allowed extensions pass regardless of case or extra dots in the name."""
+    validate_upload_file_extension(SimpleNamespace(name=filename))
+
+
+@pytest.mark.parametrize(
+    "filename", ["", "no_extension", "file.", ".", ".pdf", "archive.pdf.exe"]
+)
+def test_upload_extension_validator_rejects_invalid_extensions(filename):
+    """Missing, empty, or disallowed extensions are rejected."""
+    with pytest.raises(ValidationError):
+        validate_upload_file_extension(SimpleNamespace(name=filename))
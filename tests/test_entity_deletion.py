@@ -27,46 +27,33 @@ class TestEntityDeletionProtection:
             nes_id="entity:person/test-person", display_name="Test Person"
         )
 
-        entity_id = entity.id
         entity.delete()
 
-        # Verify entity was deleted
-        assert not JawafEntity.objects.filter(id=entity_id).exists()
+        # Django clears the primary key once the row is deleted
+        assert entity.pk is None
+
+    @pytest.mark.parametrize(
+        "nes_id, relationship_type",
+        [
+            pytest.param(
+                "entity:person/accused", RelationshipType.ACCUSED, id="accused"
+            ),
+            pytest.param(
+                "entity:person/related-person", RelationshipType.RELATED, id="related"
+            ),
+            pytest.param(
+                "entity:location/test-location",
+                RelationshipType.RELATED,
+                id="location",
+            ),
+        ],
+    )
+    def test_cannot_delete_entity_linked_to_case(self, nes_id, relationship_type):
+        """Cannot delete entity if it has any relationship to a case."""
+        entity = JawafEntity.objects.create(nes_id=nes_id, display_name="Linked")
 
-    def test_cannot_delete_entity_used_as_alleged_entity(self):
-        """Cannot delete entity if it's an accused entity in any case."""
         case = create_case_with_entities(
             title="Test Case",
-            alleged_entities=["entity:person/accused"],
-            key_allegations=["Test allegation"],
-            case_type=CaseType.CORRUPTION,
-            description="Test description",
-        )
-
-        entity = (
-            case.entity_relationships.filter(relationship_type=RelationshipType.ACCUSED)
-            .first()
-            .entity
-        )
-
-        with pytest.raises(ValidationError) as exc_info:
-            entity.delete()
-
-        assert "Cannot delete entity" in str(exc_info.value)
-        assert "entity relationship" in str(exc_info.value).lower()
-
-        # Verify entity still exists
-        assert JawafEntity.objects.filter(id=entity.id).exists()
-
-    def test_cannot_delete_entity_used_as_related_entity(self):
-        """Cannot delete entity if it's a related entity in any case."""
-        entity = JawafEntity.objects.create(
-            nes_id="entity:person/related-person", display_name="Related Person"
-        )
-
-        case = create_case_with_entities(
-            title="Test Case",
-            alleged_entities=["entity:person/accused"],
             key_allegations=["Test allegation"],
             case_type=CaseType.CORRUPTION,
             description="Test description",
@@ -74,35 +61,7 @@ class TestEntityDeletionProtection:
         CaseEntityRelationship.objects.create(
             case=case,
             entity=entity,
-            relationship_type=RelationshipType.RELATED,
-        )
-
-        with pytest.raises(ValidationError) as exc_info:
-            entity.delete()
-
-        assert "Cannot delete entity" in str(exc_info.value)
-        assert "entity relationship" in str(exc_info.value).lower()
-
-        # Verify entity still exists
-        assert JawafEntity.objects.filter(id=entity.id).exists()
-
-    def test_cannot_delete_entity_used_as_location(self):
-        """Cannot delete entity if it's linked to any case relationship."""
-        entity = JawafEntity.objects.create(
-            nes_id="entity:location/test-location", display_name="Test Location"
-        )
-
-        case = create_case_with_entities(
-            title="Test Case",
-            alleged_entities=["entity:person/accused"],
-            key_allegations=["Test allegation"],
-            case_type=CaseType.CORRUPTION,
-            description="Test description",
-        )
-        CaseEntityRelationship.objects.create(
-            case=case,
-            entity=entity,
-            relationship_type=RelationshipType.RELATED,
+            relationship_type=relationship_type,
         )
 
         with pytest.raises(ValidationError) as exc_info:
@@ -134,7 +93,9 @@ class TestEntityDeletionProtection:
         # Verify entity still exists
         assert JawafEntity.objects.filter(id=entity.id).exists()
 
-    def test_cannot_delete_entity_used_in_multiple_places(self):
+    def test_cannot_delete_entity_used_in_multiple_places(
+        self, django_assert_num_queries
+    ):
         """Cannot delete entity if it's used in multiple cases/sources."""
         entity = JawafEntity.objects.create(
             nes_id="entity:person/multi-use", display_name="Multi Use Person"
@@ -167,7 +128,8 @@ class TestEntityDeletionProtection:
             relationship_type=RelationshipType.RELATED,
         )
 
-        with pytest.raises(ValidationError) as exc_info:
+        # Both reference types are counted in a single query
+        with django_assert_num_queries(1), pytest.raises(ValidationError) as exc_info:
             entity.delete()
 
         error_message = str(exc_info.value)
@@ -191,7 +153,6 @@ class TestEntityDeletionProtection:
             relationship_type=RelationshipType.ACCUSED
         ).first()
         entity = relationship.entity
-        entity_id = entity.id
 
         # Remove entity from case
         relationship.delete()
@@ -199,8 +160,8 @@ class TestEntityDeletionProtection:
         # Now deletion should succeed
         entity.delete()
 
-        # Verify entity was deleted
-        assert not JawafEntity.objects.filter(id=entity_id).exists()
+        # Django clears the primary key once the row is deleted
+        assert entity.pk is None
 
     def test_can_delete_entity_only_used_in_deleted_source(self):
         """Can delete entity if only referenced by soft-deleted sources."""
@@ -217,8 +178,7 @@ class TestEntityDeletionProtection:
         source.related_entities.add(entity)
 
         # Should be able to delete since source is soft-deleted
-        entity_id = entity.id
         entity.delete()
 
-        # Verify entity was deleted
-        assert not JawafEntity.objects.filter(id=entity_id).exists()
+        # Django clears the primary key once the row is deleted
+        assert entity.pk is None
@@ -8,13 +8,6 @@ from django.test import RequestFactory
 
 from cases.admin import FeedbackAdmin
 from cases.models import Feedback, FeedbackType, FeedbackStatus
-from tests.conftest import create_user_with_role
-
-
-@pytest.fixture
-def admin_user():
-    """Create an admin user."""
-    return create_user_with_role("admin", "admin@example.com", "Admin")
 
 
 @pytest.fixture
@@ -27,7 +20,7 @@ def feedback_admin():
 class TestFeedbackAdmin:
     """Test suite for Feedback admin interface."""
 
-    def test_admin_can_view_feedback(self, admin_user, feedback_admin):
+    def test_admin_can_view_feedback(self, feedback_admin):
         """Test that admin can view feedback list."""
         # Create some feedback
         Feedback.objects.create(
@@ -40,8 +33,15 @@ class TestFeedbackAdmin:
         queryset = feedback_admin.get_queryset(RequestFactory().get("/"))
         assert queryset.count() == 1
 
-    def test_admin_can_change_feedback_status(self, admin_user):
-        """Test that admin can change feedback status."""
+    @pytest.mark.parametrize(
+        "field, value",
+        [
+            pytest.param("status", FeedbackStatus.IN_REVIEW, id="change-status"),
+            pytest.param("admin_notes", "Duplicate of issue #123", id="add-notes"),
+        ],
+    )
+    def test_admin_can_update_feedback(self, field, value):
+        """Test that admin can change feedback status and add notes."""
         feedback = Feedback.objects.create(
             feedback_type=FeedbackType.BUG,
             subject="Test bug",
@@ -49,27 +49,15 @@ class TestFeedbackAdmin:
             status=FeedbackStatus.SUBMITTED,
         )
 
-        # Change status
-        feedback.status = FeedbackStatus.IN_REVIEW
-        feedback.save()
+        setattr(feedback, field, value)
+        feedback.save(update_fields=[field])
 
         feedback.refresh_from_db()
-        assert feedback.status == FeedbackStatus.IN_REVIEW
-
-    def test_admin_can_add_notes(self, admin_user):
-        """Test that admin can add notes to feedback."""
-        feedback = Feedback.objects.create(
-            feedback_type=FeedbackType.BUG,
-            subject="Test bug",
-            description="Test description",
-        )
+        assert getattr(feedback, field) == value
 
-        # Add admin notes
-        feedback.admin_notes = "Duplicate of issue #123"
-        feedback.save()
 
-        feedback.refresh_from_db()
-        assert feedback.admin_notes == "Duplicate of issue #123"
+class TestFeedbackAdminConfiguration:
+    """Attribute-only checks on FeedbackAdmin; no database access needed."""
 
     def test_feedback_list_display(self, feedback_admin):
         """Test that feedback list displays correct fields."""
@@ -0,0 +1,57 @@
+"""
+Query-count guards for the shared fixture helpers in tests/conftest.py.
+
+The entity helpers run in the setup of most case and source tests, so an
+incidental per-entity query there slows the whole suite. Each test calls a
+helper with ten new entity ids and pins the query budget, so any per-id
+query trips it.
+"""
+
+import pytest
+
+from django.contrib.contenttypes.models import ContentType
+
+from cases.models import Case, CaseType, DocumentSource
+from tests.conftest import (
+    create_case_with_entities,
+    create_document_source_with_entities,
+)
+
+
+def _entity_ids(prefix, count=10):
+    return [f"entity:person/{prefix}-{i}" for i in range(count)]
+
+
+@pytest.mark.django_db
+def test_create_case_with_entities_query_budget(django_assert_num_queries):
+    """Entities and relationships are inserted in batches, not one per id."""
+    # Warm the ContentType cache so auditlog's lookup stays out of the count
+    ContentType.objects.get_for_model(Case)
+    # Case INSERT, auditlog LogEntry INSERT, existing-entity SELECT, entity
+    # INSERT, relationship INSERT
+    with django_assert_num_queries(5):
+        create_case_with_entities(
+            title="Budget case",
+            case_type=CaseType.CORRUPTION,
+            alleged_entities=_entity_ids("alleged"),
+            related_entities=_entity_ids("related"),
+        )
+
+
+@pytest.mark.django_db
+def test_create_document_source_with_entities_query_budget(
+    django_assert_max_num_queries,
+):
+    """Related entities are created and linked in batches, not one per id."""
+    # Warm the ContentType cache so auditlog's lookup stays out of the count
+    ContentType.objects.get_for_model(DocumentSource)
+    # source_id uniqueness check and INSERT, auditlog LogEntry INSERT,
+    # existing-entity SELECT, entity INSERT, then at most two for add(): the
+    # through-table INSERT plus the existing-rows SELECT Django issues when it
+    # cannot ignore conflicts.
+    with django_assert_max_num_queries(7):
+        create_document_source_with_entities(
+            title="Budget source",
+            description="Test description",
+            related_entities=_entity_ids("source"),
+        )
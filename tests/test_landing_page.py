@@ -2,25 +2,22 @@
 Tests for the landing page (index view).
 """
 
-from django.test import TestCase
 from django.urls import reverse
+from pytest_django.asserts import assertContains, assertTemplateUsed
 
 
-class LandingPageTest(TestCase):
-    """Test the landing page content and structure."""
+def test_landing_page_renders(client):
+    """Test that the landing page renders successfully with correct content."""
+    response = client.get(reverse("index"))
 
-    def test_landing_page_renders(self):
-        """Test that the landing page renders successfully with correct content."""
-        response = self.client.get(reverse("index"))
+    # Test rendering
+    assert response.status_code == 200
+    assertTemplateUsed(response, "index.html")
 
-        # Test rendering
-        self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, "index.html")
+    # Test page title
+    assertContains(response, "Jawafdehi Contributor Portal")
+    assertContains(response, "<title>Jawafdehi Contributor Portal</title>")
 
-        # Test page title
-        self.assertContains(response, "Jawafdehi Contributor Portal")
-        self.assertContains(response, "<title>Jawafdehi Contributor Portal</title>")
-
-        # Test main website link
-        self.assertContains(response, "https://jawafdehi.org")
-        self.assertContains(response, "The actual Jawafdehi website is located at")
+    # Test main website link
+    assertContains(response, "https://jawafdehi.org")
+    assertContains(response, "The actual Jawafdehi website is located at")